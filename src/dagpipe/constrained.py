@@ -8,14 +8,45 @@ Path A (optional): Outlines with OpenAI-compatible backend (token-level constrai
 No hard dependency on outlines — falls back to pydantic_retry automatically.
 """
 import json
+import re
+from functools import lru_cache
 from typing import Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
+try:
+    import msgspec
+except ImportError:  # msgspec is optional — pydantic alone works everywhere
+    msgspec = None
+
+try:
+    import outlines  # noqa: F401
+    _OUTLINES_AVAILABLE = True
+except ImportError:  # outlines is optional — pydantic_retry is the fallback
+    _OUTLINES_AVAILABLE = False
+
 
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=128)
+def _schema_instruction_for(schema: Type[BaseModel]) -> str:
+    """Build the schema instruction block for a schema class.
+
+    model_json_schema() and json.dumps() are deterministic per class,
+    so the result is cached — retry loops and repeated nodes using the
+    same schema pay the cost once.
+    """
+    schema_json = json.dumps(schema.model_json_schema(), indent=2)
+    return (
+        "\n\nYou MUST respond with ONLY a valid JSON object matching this schema:\n"
+        f"```json\n{schema_json}\n```\n"
+        "Do NOT include any text before or after the JSON. "
+        "Do NOT wrap in markdown code blocks. "
+        "Output ONLY the raw JSON object starting with {{ and ending with }}."
+    )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # PUBLIC API
 # ─────────────────────────────────────────────────────────────────────────────
@@ -60,16 +91,12 @@ def _generate_pydantic_retry(
     **llm_kwargs,
 ) -> T:
     """Raw LLM call → extract JSON → validate against Pydantic schema → retry."""
-    schema_json = json.dumps(schema.model_json_schema(), indent=2)
-    schema_instruction = (
-        "\n\nYou MUST respond with ONLY a valid JSON object matching this schema:\n"
-        f"```json\n{schema_json}\n```\n"
-        "Do NOT include any text before or after the JSON. "
-        "Do NOT wrap in markdown code blocks. "
-        "Output ONLY the raw JSON object starting with {{ and ending with }}."
-    )
+    schema_instruction = _schema_instruction_for(schema)
 
-    enhanced_messages = _inject_schema_instruction(messages, schema_instruction)
+    # Built once — retries only append the short error feedback to this
+    # instead of re-embedding the schema block into the original messages.
+    base_messages = _inject_schema_instruction(messages, schema_instruction)
+    enhanced_messages = base_messages
 
     last_error = None
     for attempt in range(max_retries + 1):
@@ -80,7 +107,7 @@ def _generate_pydantic_retry(
             json_str = _extract_json(raw)
 
             # Validate against schema
-            result = schema.model_validate_json(json_str)
+            result = _validate_json(schema, json_str)
             return result
 
         except (ValidationError, json.JSONDecodeError, ValueError) as e:
@@ -93,7 +120,7 @@ def _generate_pydantic_retry(
                     f"Fix the error and respond with ONLY the corrected JSON."
                 )
                 enhanced_messages = _inject_schema_instruction(
-                    messages, schema_instruction + error_feedback
+                    base_messages, error_feedback
                 )
 
     raise ValueError(
@@ -115,11 +142,10 @@ def _generate_outlines(
     """Outlines with OpenAI-compatible backend.
 
     Falls back to pydantic_retry if outlines is not installed or
-    remote API wiring is not yet stable.
+    remote API wiring is not yet stable. Availability is resolved once
+    at module import, not per call.
     """
-    try:
-        import outlines  # noqa: F401
-
+    if _OUTLINES_AVAILABLE:
         # Outlines remote API integration with OpenAI-compatible endpoints
         # is still evolving. When stable, wire up here:
         #   from outlines import models, generate
@@ -127,26 +153,49 @@ def _generate_outlines(
         #   generator = generate.json(model, schema)
         #   result = generator(prompt)
         #   return result
+        pass
 
-        # For now, fall back to pydantic retry
-        raise ImportError("Outlines remote API not yet wired — falling back")
-
-    except ImportError:
-        return _generate_pydantic_retry(messages, schema, llm_call_fn, **llm_kwargs)
+    # For now, fall back to pydantic retry
+    return _generate_pydantic_retry(messages, schema, llm_call_fn, **llm_kwargs)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # HELPERS
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _validate_json(schema: Type[T], json_str: str) -> T:
+    """Validate a JSON string against a Pydantic schema.
+
+    When msgspec is installed, its C decoder parses the JSON first and
+    the resulting dict is handed to model_validate() — skipping
+    Pydantic's string parser while keeping validator semantics.
+    msgspec.DecodeError subclasses ValueError, so callers catching
+    ValueError see the same failure surface either way.
+    """
+    if msgspec is not None:
+        return schema.model_validate(msgspec.json.decode(json_str.encode()))
+    return schema.model_validate_json(json_str)
+
+
 def _inject_schema_instruction(messages: list[dict], instruction: str) -> list[dict]:
-    """Clone messages and append schema instruction to the last user message."""
-    cloned = [m.copy() for m in messages]
-    for i in range(len(cloned) - 1, -1, -1):
-        if cloned[i]["role"] == "user":
-            cloned[i]["content"] += instruction
+    """Append schema instruction to the last user message.
+
+    Returns a new list; only the targeted message dict is copied, the
+    rest are shared with the caller's list.
+    """
+    out = list(messages)
+    for i in range(len(out) - 1, -1, -1):
+        if out[i]["role"] == "user":
+            m = out[i].copy()
+            m["content"] = m["content"] + instruction
+            out[i] = m
             break
-    return cloned
+    return out
+
+
+# Matches a markdown-fenced JSON block first, then falls back to the
+# outermost {...} span anywhere in the response.
+_JSON_RE = re.compile(r"(?s)```(?:json)?\s*(\{.*\})\s*```|(\{.*\})")
 
 
 def _extract_json(raw: str) -> str:
@@ -156,22 +205,11 @@ def _extract_json(raw: str) -> str:
     - Raw JSON: {"key": "value"}
     - Markdown-wrapped: ```json\\n{"key": "value"}\\n```
     - Text before/after JSON: "Here is the result: {"key": "value"} Done."
+
+    A single precompiled regex does the scan in C instead of chained
+    strip/startswith/find string ops.
     """
-    raw = raw.strip()
-
-    # Remove markdown code block wrappers
-    if raw.startswith("```json"):
-        raw = raw[7:]
-    elif raw.startswith("```"):
-        raw = raw[3:]
-    if raw.endswith("```"):
-        raw = raw[:-3]
-    raw = raw.strip()
-
-    # Find the outermost JSON object
-    start = raw.find("{")
-    end = raw.rfind("}")
-    if start != -1 and end != -1 and end > start:
-        return raw[start : end + 1]
-
-    return raw  # Return as-is — let Pydantic report the error
+    m = _JSON_RE.search(raw)
+    if m is not None:
+        return m.group(1) or m.group(2)
+    return raw.strip()  # Return as-is — let Pydantic report the error
@@ -15,23 +15,38 @@ Usage:
     orch = PipelineOrchestrator(nodes=nodes, node_registry=registry)
     result = orch.run()
 """
+import hashlib
+import json
+import sys
 import time
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Any
 
 from pydantic import BaseModel
 
-from .checkpoints import checkpoint, restore, clear_checkpoints
+from .checkpoints import (
+    checkpoint,
+    checkpoint_many,
+    clear_checkpoints,
+    restore,
+    restore_all,
+)
 from .router import ModelRouter
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C extension
+except ImportError:  # pure-Python parser works everywhere
+    from yaml import SafeLoader as _YamlLoader
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # DAG NODE
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class DAGNode:
     """A single node in the execution DAG.
 
@@ -54,6 +69,14 @@ class DAGNode:
 
     _fn: Callable | None = field(default=None, repr=False)
 
+    def __post_init__(self) -> None:
+        # Intern identity strings — large DAGs repeat the same dep names
+        # across many nodes, and interned ids make the orchestrator's
+        # state lookups pointer comparisons.
+        self.id = sys.intern(self.id)
+        self.fn_name = sys.intern(self.fn_name)
+        self.depends_on = [sys.intern(d) for d in self.depends_on]
+
     def resolve_fn(self, registry: dict[str, Callable]) -> None:
         """Resolve function name to actual callable from a registry dict.
 
@@ -95,6 +118,14 @@ class DAGNode:
 # DAG LOADING
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Parsed configs keyed by path, holding (mtime_ns, config) — repeated
+# orchestrator construction over the same file skips the YAML parse,
+# and an edited file replaces its stale entry instead of accumulating
+# beside it. Fresh DAGNode objects are still built per call, so
+# callers never share node state.
+_dag_config_cache: dict[str, tuple[int, dict]] = {}
+
+
 def load_dag(config_path: Path) -> list[DAGNode]:
     """Load DAG configuration from a YAML file.
 
@@ -114,8 +145,15 @@ def load_dag(config_path: Path) -> list[DAGNode]:
     Returns:
         List of DAGNode objects (NOT yet topologically sorted).
     """
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    path_key = str(config_path)
+    mtime_ns = config_path.stat().st_mtime_ns
+    cached = _dag_config_cache.get(path_key)
+    if cached is not None and cached[0] == mtime_ns:
+        config = cached[1]
+    else:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+        _dag_config_cache[path_key] = (mtime_ns, config)
 
     nodes: list[DAGNode] = []
     for node_cfg in config["nodes"]:
@@ -138,7 +176,9 @@ def load_dag(config_path: Path) -> list[DAGNode]:
 def topological_sort(nodes: list[DAGNode]) -> list[DAGNode]:
     """Sort nodes in dependency order. Raises ValueError on cycles.
 
-    Uses depth-first traversal with cycle detection.
+    Implemented as Kahn's algorithm over integer adjacency arrays (a
+    flattened topological_waves) — iterative, no recursion limit on
+    deep DAGs, and a single linear sweep per layer.
 
     Args:
         nodes: Unsorted list of DAGNode objects.
@@ -149,33 +189,81 @@ def topological_sort(nodes: list[DAGNode]) -> list[DAGNode]:
     Raises:
         ValueError: If a cycle is detected or an unknown dependency is found.
     """
-    node_map: dict[str, DAGNode] = {n.id: n for n in nodes}
-    visited: set[str] = set()
-    visiting: set[str] = set()
-    order: list[DAGNode] = []
+    return [n for wave in topological_waves(nodes) for n in wave]
+
 
-    def visit(node_id: str) -> None:
-        if node_id in visiting:
-            raise ValueError(f"Cycle detected involving node: {node_id}")
-        if node_id in visited:
-            return
-        visiting.add(node_id)
+def topological_waves(nodes: list[DAGNode]) -> list[list[DAGNode]]:
+    """Group nodes into dependency waves using Kahn's algorithm.
 
-        node = node_map.get(node_id)
-        if node is None:
-            raise ValueError(f"Unknown dependency: {node_id}")
+    Each wave holds nodes whose dependencies are all satisfied by
+    earlier waves, so members of one wave can execute concurrently.
 
-        for dep in node.depends_on:
-            visit(dep)
+    Args:
+        nodes: Unsorted list of DAGNode objects.
 
-        visiting.remove(node_id)
-        visited.add(node_id)
-        order.append(node)
+    Returns:
+        List of waves, each a list of DAGNode objects.
 
-    for n in nodes:
-        visit(n.id)
+    Raises:
+        ValueError: If a cycle is detected or an unknown dependency is found.
+    """
+    index: dict[str, int] = {n.id: i for i, n in enumerate(nodes)}
+    n_nodes = len(nodes)
+    indegree = [0] * n_nodes
+    dependents: list[list[int]] = [[] for _ in range(n_nodes)]
+
+    # The layering itself runs on integer arrays only — node objects
+    # are touched again just to materialize the result waves.
+    for i, n in enumerate(nodes):
+        indegree[i] = len(n.depends_on)
+        for dep in n.depends_on:
+            j = index.get(dep)
+            if j is None:
+                raise ValueError(f"Unknown dependency: {dep}")
+            dependents[j].append(i)
+
+    ready = [i for i in range(n_nodes) if indegree[i] == 0]
+    waves: list[list[DAGNode]] = []
+    placed = 0
+
+    while ready:
+        waves.append([nodes[i] for i in ready])
+        placed += len(ready)
+        next_ready: list[int] = []
+        for i in ready:
+            for child in dependents[i]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    next_ready.append(child)
+        ready = next_ready
+
+    if placed != n_nodes:
+        stuck = min(nodes[i].id for i in range(n_nodes) if indegree[i] > 0)
+        raise ValueError(f"Cycle detected involving node: {stuck}")
+
+    return waves
+
+
+def _memo_key(node: DAGNode, context: dict[str, Any]) -> str:
+    """Content-addressed checkpoint key for a node and its inputs.
+
+    Two runs that feed a node identical context reuse the same
+    checkpoint, so unchanged portions of the DAG skip re-execution
+    across runs — not just within one resumed run.
+    """
+    blob = json.dumps(
+        {"id": node.id, "fn": node.fn_name, "ctx": context},
+        sort_keys=True,
+        default=str,
+    ).encode("utf-8")
+    digest = hashlib.blake2b(blob, digest_size=16).hexdigest()
+    return f"{node.id}@{digest}"
 
-    return order
+
+# Wave layouts keyed by DAG shape — re-instantiating an orchestrator
+# over the same graph (per-request patterns, tests) skips the O(V+E)
+# layering. Values are index lists into the caller's node order.
+_wave_cache: dict[tuple, list[list[int]]] = {}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -193,9 +281,13 @@ class PipelineOrchestrator:
         node_registry: Dict mapping fn_name → callable.
         router: Optional ModelRouter for LLM-backed nodes.
             If None, all nodes get model=None (deterministic mode).
-        checkpoint_dir: Directory for checkpoint JSON files.
+        checkpoint_dir: Directory for checkpoint storage.
         max_retries: Max attempts per node before raising RuntimeError.
         on_node_complete: Optional callback(node_id, result, duration).
+        max_workers: Max nodes of one wave executed concurrently.
+        memoize: If True, checkpoints are keyed by node id + input
+            context hash instead of node id alone, so unchanged nodes
+            are skipped across runs, not just within a resumed run.
     """
 
     def __init__(
@@ -206,6 +298,8 @@ class PipelineOrchestrator:
         checkpoint_dir: Path = Path(".dagpipe/checkpoints"),
         max_retries: int = 3,
         on_node_complete: Callable[..., Any] | None = None,
+        max_workers: int = 4,
+        memoize: bool = False,
     ) -> None:
         # Load from YAML if a Path is given
         if isinstance(nodes, Path):
@@ -213,14 +307,45 @@ class PipelineOrchestrator:
         else:
             self._raw_nodes = list(nodes)
 
-        self.sorted_nodes = topological_sort(self._raw_nodes)
+        sig = tuple((n.id, tuple(n.depends_on)) for n in self._raw_nodes)
+        wave_idx = _wave_cache.get(sig)
+        if wave_idx is None:
+            pos = {n.id: i for i, n in enumerate(self._raw_nodes)}
+            wave_idx = [
+                [pos[n.id] for n in wave]
+                for wave in topological_waves(self._raw_nodes)
+            ]
+            _wave_cache[sig] = wave_idx
+        self.waves = [[self._raw_nodes[i] for i in wave] for wave in wave_idx]
+        self.sorted_nodes = [n for wave in self.waves for n in wave]
+
+        # Ids/deps are interned by DAGNode.__post_init__; freeze each
+        # node's dependency list into a tuple for the context builder.
+        self._dep_tuples: dict[str, tuple[str, ...]] = {
+            n.id: tuple(n.depends_on) for n in self.sorted_nodes
+        }
+
         self.state: dict[str, Any] = {}
         self.max_retries = max_retries
+        self.max_workers = max_workers
+        self.memoize = memoize
         self.router = router
         self.checkpoint_dir = checkpoint_dir
         self.on_node_complete = on_node_complete
 
-        # Resolve every node's function from the registry
+        # Resolve every node's function from the registry eagerly,
+        # reporting all missing entries in one error instead of failing
+        # on the first.
+        missing = [
+            f"'{n.id}' → '{n.fn_name}'"
+            for n in self.sorted_nodes
+            if n.fn_name not in node_registry
+        ]
+        if missing:
+            raise KeyError(
+                f"Nodes reference functions missing from the node "
+                f"registry: {', '.join(missing)}"
+            )
         for node in self.sorted_nodes:
             node.resolve_fn(node_registry)
 
@@ -247,41 +372,92 @@ class PipelineOrchestrator:
 
         self.state = dict(initial_state) if initial_state else {}
 
-        # Restore existing checkpoints
-        for node in self.sorted_nodes:
-            cached = restore(node.id, checkpoint_dir=self.checkpoint_dir)
-            if cached is not None:
-                self.state[node.id] = cached
+        # Restore existing checkpoints with one query. Content-addressed
+        # keys depend on upstream outputs, so memoized restores happen
+        # per wave instead.
+        if not self.memoize:
+            cached = restore_all(checkpoint_dir=self.checkpoint_dir)
+            for node in self.sorted_nodes:
+                if node.id in cached:
+                    self.state[node.id] = cached[node.id]
+
+        # Execute waves in dependency order; siblings within a wave
+        # are independent and run concurrently (LLM calls are I/O-bound).
+        for wave in self.waves:
+            # Build context per node from dependencies + initial state;
+            # with memoization on, matching checkpoints short-circuit here.
+            pending: list[DAGNode] = []
+            contexts: list[dict[str, Any]] = []
+            ckpt_keys: list[str] = []
+            for node in wave:
+                if node.id in self.state:
+                    continue  # Already completed (checkpoint hit)
+                # Initial-state keys plus satisfied dependencies, built
+                # with C-level dict operations rather than a Python loop
+                context: dict[str, Any] = {
+                    **(initial_state or {}),
+                    **{
+                        dep_id: self.state[dep_id]
+                        for dep_id in self._dep_tuples[node.id]
+                        if dep_id in self.state
+                    },
+                }
+
+                key = node.id
+                if self.memoize:
+                    key = _memo_key(node, context)
+                    cached = restore(key, checkpoint_dir=self.checkpoint_dir)
+                    if cached is not None:
+                        self.state[node.id] = cached
+                        continue
+                pending.append(node)
+                contexts.append(context)
+                ckpt_keys.append(key)
+
+            if not pending:
+                continue  # Whole wave already completed
+
+            # Execute with retries — inline for a single node, pooled
+            # for a wave of siblings.
+            if len(pending) == 1:
+                results = [self._execute_node(pending[0], contexts[0])]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, len(pending))
+                ) as pool:
+                    results = list(pool.map(self._execute_node, pending, contexts))
+
+            # Commit every successful sibling (state + checkpoint) before
+            # surfacing a failure — a resumed run must skip the nodes that
+            # did succeed, even when a wave-mate exhausted its retries.
+            completed: list[tuple[str, dict[str, Any]]] = []
+            failed: DAGNode | None = None
+            for node, key, result in zip(pending, ckpt_keys, results):
+                if result is None:
+                    if failed is None:
+                        failed = node
+                    continue
+                self.state[node.id] = result
+                completed.append((key, result))
+
+            # Commit the wave's successes in one batch
+            if len(completed) == 1:
+                checkpoint(
+                    completed[0][0], completed[0][1],
+                    checkpoint_dir=self.checkpoint_dir,
+                )
+            elif completed:
+                checkpoint_many(
+                    completed,
+                    checkpoint_dir=self.checkpoint_dir,
+                )
 
-        # Execute nodes in topological order
-        for node in self.sorted_nodes:
-            if node.id in self.state:
-                continue  # Already completed (checkpoint hit)
-
-            # Build context from dependencies + initial state
-            context: dict[str, Any] = {}
-            # Include any initial_state keys
-            if initial_state:
-                context.update(initial_state)
-            for dep_id in node.depends_on:
-                if dep_id in self.state:
-                    context[dep_id] = self.state[dep_id]
-
-            # Execute with retries
-            result = self._execute_node(node, context)
-
-            if result is None:
+            if failed is not None:
                 raise RuntimeError(
-                    f"Pipeline failed at node '{node.id}' "
+                    f"Pipeline failed at node '{failed.id}' "
                     f"after {self.max_retries} retries."
                 )
 
-            # Store result and checkpoint
-            self.state[node.id] = result
-            checkpoint(
-                node.id, result, checkpoint_dir=self.checkpoint_dir
-            )
-
         return self.state
 
     def _execute_node(
@@ -298,13 +474,19 @@ class PipelineOrchestrator:
         Returns:
             Output dict, or None if all retries are exhausted.
         """
-        t_start = time.time()
+        t_start_ns = time.perf_counter_ns()
         last_error_msg = ""
 
+        # Routing is skipped entirely for deterministic/router-less nodes;
+        # decided once here rather than re-branching per attempt. route()
+        # itself is stateful (rate-limit budget) so it cannot be
+        # pre-resolved at __init__ without consuming budget early.
+        needs_routing = not node.is_deterministic and self.router is not None
+
         for attempt in range(self.max_retries):
             try:
                 # Route to appropriate model
-                if node.is_deterministic or self.router is None:
+                if not needs_routing:
                     model = None
                 elif attempt == 0:
                     model, _ = self.router.route(node.complexity)
@@ -313,14 +495,17 @@ class PipelineOrchestrator:
                         node.complexity, attempt, last_error_msg
                     )
 
-                # Execute the node function
-                result = node.execute(context=context, model=model)
+                # Execute the node function — call the resolved callable
+                # directly; __init__ guarantees resolution, so the
+                # execute() wrapper's not-resolved guard is dead weight
+                # on this per-attempt path.
+                result = node._fn(context=context, model=model)
 
                 # Convert Pydantic model to dict if needed
                 if isinstance(result, BaseModel):
                     result = result.model_dump()
 
-                duration = time.time() - t_start
+                duration = (time.perf_counter_ns() - t_start_ns) / 1e9
 
                 # Fire callback if provided
                 if self.on_node_complete is not None:
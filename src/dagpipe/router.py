@@ -6,7 +6,10 @@ Python decides — LLM never sees the routing logic.
 The router does NOT own LLM clients. Users pass provider callables at init.
 The router only decides WHICH callable to invoke based on complexity score.
 """
+import re
+import threading
 import time
+from functools import lru_cache
 from typing import Callable
 
 
@@ -26,9 +29,31 @@ _COMPLEXITY_KEYWORDS_LOW = frozenset({
 })
 
 
+def _keyword_pattern(keywords: frozenset[str]) -> re.Pattern:
+    """Compile a keyword set into one alternation pattern.
+
+    Longer keywords come first so e.g. "across files" wins over any
+    shorter overlapping alternative at the same position.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in ordered), re.IGNORECASE)
+
+
+_HIGH_RE = _keyword_pattern(_COMPLEXITY_KEYWORDS_HIGH)
+_LOW_RE = _keyword_pattern(_COMPLEXITY_KEYWORDS_LOW)
+
+# Errors that should bypass the high-complexity provider on retry —
+# one compiled scan instead of a substring search per keyword.
+_FALLBACK_ERROR_RE = re.compile(r"Access denied|APIError|rate limit")
+
+
+@lru_cache(maxsize=1024)
 def classify_complexity(task_description: str, token_count: int = 0) -> float:
     """Estimate task complexity without an LLM call.
 
+    Pure and deterministic, so results are memoized — retries and
+    reruns over the same task description hit the cache.
+
     Args:
         task_description: Human-readable task text.
         token_count: Estimated token count (len(text) // 4).
@@ -36,15 +61,14 @@ def classify_complexity(task_description: str, token_count: int = 0) -> float:
     Returns:
         Float between 0.0 and 1.0.
     """
-    desc_lower = task_description.lower()
     score = 0.5  # baseline
 
-    for kw in _COMPLEXITY_KEYWORDS_HIGH:
-        if kw in desc_lower:
-            score += 0.1
-    for kw in _COMPLEXITY_KEYWORDS_LOW:
-        if kw in desc_lower:
-            score -= 0.1
+    # One case-insensitive compiled scan per keyword set — no full
+    # lowered copy of the description, and no substring search per
+    # keyword. Matches are lowercased (they are short) and deduplicated
+    # to keep presence (not occurrence) scoring.
+    score += 0.1 * len({m.lower() for m in _HIGH_RE.findall(task_description)})
+    score -= 0.1 * len({m.lower() for m in _LOW_RE.findall(task_description)})
 
     # Token count factor (more context = likely more complex)
     if token_count > 4000:
@@ -96,24 +120,29 @@ class ModelRouter:
         self._threshold = complexity_threshold
         self._rpm_limit = groq_rpm_limit
 
-        # Rate limit budget tracker
-        self._calls_remaining = groq_rpm_limit
-        self._last_reset = time.time()
-        self._window_s = 60
+        # Token-bucket budget tracker — refills continuously at
+        # rpm_limit per minute instead of resetting in 60s bursts.
+        # Lock-guarded so concurrent wave execution cannot overshoot;
+        # monotonic clock is immune to wall-clock steps.
+        self._tokens = float(groq_rpm_limit)
+        self._last_ns = time.perf_counter_ns()
+        self._budget_lock = threading.Lock()
 
     # ── Rate limit budget ────────────────────────────────────────────────
 
-    def _check_budget(self) -> bool:
-        """Check if the high-complexity provider budget allows a call."""
-        now = time.time()
-        if now - self._last_reset > self._window_s:
-            self._calls_remaining = self._rpm_limit
-            self._last_reset = now
-        return self._calls_remaining > 0
-
-    def _consume_budget(self) -> None:
-        """Decrement the high-complexity provider call budget."""
-        self._calls_remaining -= 1
+    def _try_consume_budget(self) -> bool:
+        """Atomically refill and consume one high-complexity token."""
+        with self._budget_lock:
+            now = time.perf_counter_ns()
+            self._tokens = min(
+                float(self._rpm_limit),
+                self._tokens + (now - self._last_ns) * (self._rpm_limit / 60e9),
+            )
+            self._last_ns = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
 
     # ── Routing ──────────────────────────────────────────────────────────
 
@@ -129,8 +158,7 @@ class ModelRouter:
         if complexity < self._threshold:
             return self._low_fn, self._low_label
 
-        if self._check_budget():
-            self._consume_budget()
+        if self._try_consume_budget():
             return self._high_fn, self._high_label
 
         return self._fallback_fn, self._fallback_label
@@ -154,7 +182,7 @@ class ModelRouter:
         Returns:
             Tuple of (callable, label_string).
         """
-        if any(kw in last_error for kw in ("Access denied", "APIError", "rate limit")):
+        if _FALLBACK_ERROR_RE.search(last_error):
             return self._fallback_fn, self._fallback_label
 
         escalated = min(1.0, complexity + (attempt * 0.2))
@@ -4,20 +4,21 @@ from pathlib import Path
 from dagpipe.checkpoints import (
     checkpoint,
     checkpoint_exists,
+    checkpoint_many,
     clear_checkpoints,
     list_checkpoints,
     restore,
+    restore_all,
 )
 
 
-def test_checkpoint_saves_file(tmp_path: Path) -> None:
-    """checkpoint() creates a JSON file on disk."""
+def test_checkpoint_saves_to_store(tmp_path: Path) -> None:
+    """checkpoint() persists the node output in the on-disk store."""
     data = {"result": "hello", "score": 42}
     checkpoint("node_a", data, checkpoint_dir=tmp_path)
 
-    saved = tmp_path / "node_a.json"
-    assert saved.exists()
-    assert saved.suffix == ".json"
+    assert (tmp_path / "checkpoints.db").exists()
+    assert checkpoint_exists("node_a", checkpoint_dir=tmp_path) is True
 
 
 def test_restore_loads_correctly(tmp_path: Path) -> None:
@@ -43,14 +44,14 @@ def test_checkpoint_exists_returns_true_false(tmp_path: Path) -> None:
     assert checkpoint_exists("node_c", checkpoint_dir=tmp_path) is True
 
 
-def test_clear_checkpoints_wipes_directory(tmp_path: Path) -> None:
-    """clear_checkpoints() removes all .json files in the checkpoint dir."""
+def test_clear_checkpoints_wipes_store(tmp_path: Path) -> None:
+    """clear_checkpoints() removes every saved checkpoint."""
     checkpoint("x", {"a": 1}, checkpoint_dir=tmp_path)
     checkpoint("y", {"b": 2}, checkpoint_dir=tmp_path)
-    assert len(list(tmp_path.glob("*.json"))) == 2
+    assert list_checkpoints(checkpoint_dir=tmp_path) == ["x", "y"]
 
     clear_checkpoints(checkpoint_dir=tmp_path)
-    assert len(list(tmp_path.glob("*.json"))) == 0
+    assert list_checkpoints(checkpoint_dir=tmp_path) == []
 
 
 def test_list_checkpoints(tmp_path: Path) -> None:
@@ -68,10 +69,52 @@ def test_list_checkpoints_empty(tmp_path: Path) -> None:
     assert result == []
 
 
+def test_checkpoint_many_saves_all(tmp_path: Path) -> None:
+    """checkpoint_many() persists every (node_id, output) pair."""
+    checkpoint_many(
+        [("a", {"v": 1}), ("b", {"v": 2}), ("c", {"v": 3})],
+        checkpoint_dir=tmp_path,
+    )
+
+    assert list_checkpoints(checkpoint_dir=tmp_path) == ["a", "b", "c"]
+    assert restore("b", checkpoint_dir=tmp_path) == {"v": 2}
+
+
+def test_restore_all_returns_every_checkpoint(tmp_path: Path) -> None:
+    """restore_all() loads all saved outputs in one call."""
+    checkpoint("a", {"v": 1}, checkpoint_dir=tmp_path)
+    checkpoint("b", {"v": 2}, checkpoint_dir=tmp_path)
+
+    result = restore_all(checkpoint_dir=tmp_path)
+    assert result == {"a": {"v": 1}, "b": {"v": 2}}
+    assert restore_all(checkpoint_dir=tmp_path / "empty") == {}
+
+
+def test_read_paths_do_not_create_store(tmp_path: Path) -> None:
+    """Probing a never-checkpointed directory leaves no store behind."""
+    probe = tmp_path / "probe"
+
+    assert restore("x", checkpoint_dir=probe) is None
+    assert restore_all(checkpoint_dir=probe) == {}
+    assert checkpoint_exists("x", checkpoint_dir=probe) is False
+    assert list_checkpoints(checkpoint_dir=probe) == []
+    clear_checkpoints(checkpoint_dir=probe)
+
+    assert not probe.exists()
+
+
 def test_restore_handles_corrupt_json(tmp_path: Path) -> None:
-    """restore() returns None (not crash) on corrupt JSON."""
-    bad_file = tmp_path / "corrupt.json"
-    bad_file.write_text("{this is not json", encoding="utf-8")
+    """restore() returns None (not crash) on a corrupt stored blob."""
+    import sqlite3
+
+    checkpoint("seed", {"ok": True}, checkpoint_dir=tmp_path)
+    con = sqlite3.connect(tmp_path / "checkpoints.db")
+    con.execute(
+        "INSERT OR REPLACE INTO cp VALUES(?, ?)",
+        ("corrupt", b"{this is not json"),
+    )
+    con.commit()
+    con.close()
 
     result = restore("corrupt", checkpoint_dir=tmp_path)
     assert result is None
@@ -4,7 +4,18 @@ import yaml
 from pathlib import Path
 from typing import Any
 
-from dagpipe.dag import DAGNode, load_dag, topological_sort, PipelineOrchestrator
+from dagpipe.dag import (
+    DAGNode,
+    PipelineOrchestrator,
+    load_dag,
+    topological_sort,
+    topological_waves,
+)
+
+try:
+    from yaml import CSafeDumper as _YamlDumper  # libyaml C extension
+except ImportError:  # pure-Python emitter works everywhere
+    from yaml import SafeDumper as _YamlDumper
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -54,7 +65,7 @@ def _make_two_node_yaml(tmp_path: Path) -> Path:
         ]
     }
     yaml_path = tmp_path / "pipeline.yaml"
-    yaml_path.write_text(yaml.dump(config), encoding="utf-8")
+    yaml_path.write_text(yaml.dump(config, Dumper=_YamlDumper), encoding="utf-8")
     return yaml_path
 
 
@@ -106,6 +117,34 @@ def test_topological_sort_raises_on_cycle() -> None:
         topological_sort(nodes)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# TEST 3b: topological_waves() groups independent siblings
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_topological_waves_groups_siblings() -> None:
+    """Diamond DAG layers into [source], [both siblings], [sink]."""
+    nodes = [
+        DAGNode(id="sink", fn_name="f", depends_on=["left", "right"]),
+        DAGNode(id="left", fn_name="f", depends_on=["source"]),
+        DAGNode(id="right", fn_name="f", depends_on=["source"]),
+        DAGNode(id="source", fn_name="f"),
+    ]
+    waves = topological_waves(nodes)
+
+    wave_ids = [sorted(n.id for n in wave) for wave in waves]
+    assert wave_ids == [["source"], ["left", "right"], ["sink"]]
+
+
+def test_topological_waves_raises_on_cycle() -> None:
+    """ValueError raised when the graph contains a cycle."""
+    nodes = [
+        DAGNode(id="a", fn_name="f", depends_on=["b"]),
+        DAGNode(id="b", fn_name="f", depends_on=["a"]),
+    ]
+    with pytest.raises(ValueError, match="Cycle detected"):
+        topological_waves(nodes)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # TEST 4: PipelineOrchestrator runs 2-node pipeline end to end
 # ─────────────────────────────────────────────────────────────────────────────
@@ -133,6 +172,38 @@ def test_pipeline_runs_two_nodes_e2e(tmp_path: Path) -> None:
     assert "draft" in result["write"]
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# TEST 4b: Diamond DAG runs siblings concurrently and fans in
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_pipeline_runs_diamond_dag(tmp_path: Path) -> None:
+    """Independent siblings both execute; sink sees both outputs."""
+    def _left(context: dict[str, Any], model: Any = None) -> dict[str, Any]:
+        return {"side": "left"}
+
+    def _right(context: dict[str, Any], model: Any = None) -> dict[str, Any]:
+        return {"side": "right"}
+
+    def _sink(context: dict[str, Any], model: Any = None) -> dict[str, Any]:
+        return {"merged": [context["left"]["side"], context["right"]["side"]]}
+
+    nodes = [
+        DAGNode(id="left", fn_name="do_left"),
+        DAGNode(id="right", fn_name="do_right"),
+        DAGNode(id="sink", fn_name="do_sink", depends_on=["left", "right"]),
+    ]
+    registry = {"do_left": _left, "do_right": _right, "do_sink": _sink}
+
+    orch = PipelineOrchestrator(
+        nodes=nodes,
+        node_registry=registry,
+        checkpoint_dir=tmp_path / "ckpt",
+    )
+    result = orch.run()
+
+    assert sorted(result["sink"]["merged"]) == ["left", "right"]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # TEST 5: Completed nodes skipped when checkpoint exists
 # ─────────────────────────────────────────────────────────────────────────────
@@ -164,6 +235,39 @@ def test_checkpoint_skip(tmp_path: Path) -> None:
     assert call_count["research"] == 1  # NOT incremented
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# TEST 5b: Memoized runs reuse results keyed by input context
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_memoize_skips_nodes_with_unchanged_inputs(tmp_path: Path) -> None:
+    """memoize=True reuses checkpoints across runs for identical inputs."""
+    call_count = {"echo": 0}
+
+    def echo(context: dict[str, Any], model: Any = None) -> dict[str, Any]:
+        call_count["echo"] += 1
+        return {"echo": context.get("topic")}
+
+    nodes = [DAGNode(id="step", fn_name="do_echo")]
+    registry = {"do_echo": echo}
+    ckpt_dir = tmp_path / "ckpt"
+
+    def make_orch() -> PipelineOrchestrator:
+        return PipelineOrchestrator(
+            nodes=nodes, node_registry=registry,
+            checkpoint_dir=ckpt_dir, memoize=True,
+        )
+
+    # Same input twice — second run hits the memoized checkpoint
+    make_orch().run(initial_state={"topic": "a"})
+    make_orch().run(initial_state={"topic": "a"})
+    assert call_count["echo"] == 1
+
+    # Changed input — node re-executes
+    result = make_orch().run(initial_state={"topic": "b"})
+    assert call_count["echo"] == 2
+    assert result["step"]["echo"] == "b"
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # TEST 6: Failed node after max_retries raises RuntimeError
 # ─────────────────────────────────────────────────────────────────────────────
@@ -183,6 +287,37 @@ def test_failed_node_raises_runtime_error(tmp_path: Path) -> None:
         orch.run()
 
 
+def test_failed_wave_persists_successful_siblings(tmp_path: Path) -> None:
+    """A failing node does not discard checkpoints of wave siblings."""
+    call_count = {"good": 0}
+
+    def good(context: dict[str, Any], model: Any = None) -> dict[str, Any]:
+        call_count["good"] += 1
+        return {"ok": True}
+
+    nodes = [
+        DAGNode(id="good", fn_name="do_good"),
+        DAGNode(id="bad", fn_name="do_fail"),
+    ]
+    registry = {"do_good": good, "do_fail": _dummy_fail}
+    ckpt_dir = tmp_path / "ckpt"
+
+    def make_orch() -> PipelineOrchestrator:
+        return PipelineOrchestrator(
+            nodes=nodes, node_registry=registry,
+            checkpoint_dir=ckpt_dir, max_retries=1,
+        )
+
+    with pytest.raises(RuntimeError, match="Pipeline failed at node 'bad'"):
+        make_orch().run()
+    assert call_count["good"] == 1
+
+    # Resume — 'good' is checkpointed and must NOT re-execute
+    with pytest.raises(RuntimeError, match="Pipeline failed at node 'bad'"):
+        make_orch().run()
+    assert call_count["good"] == 1
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # TEST 7: on_node_complete callback fires for each successful node
 # ─────────────────────────────────────────────────────────────────────────────